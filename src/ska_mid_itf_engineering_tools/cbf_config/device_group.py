@@ -0,0 +1,164 @@
+"""A group of Tango devices whose proxies are built and read concurrently."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+from tango import DevFailed, DeviceProxy
+
+DEFAULT_READ_TIMEOUT_MS = 3000
+
+
+@dataclass
+class GroupReading:
+    """Attribute values read from a group of devices."""
+
+    values: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    errors: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    def __getitem__(self, device: str) -> Dict[str, Any]:
+        """
+        Get the attribute values read from a device.
+
+        Attributes which could not be read are None.
+
+        :param device: the device name.
+        :type device: str
+        :return: attribute values keyed by attribute name.
+        :rtype: Dict[str, Any]
+        """
+        return self.values[device]
+
+    @property
+    def ok(self) -> bool:
+        """
+        Determine whether every attribute was read successfully.
+
+        :return: True if there were no errors, False otherwise.
+        :rtype: bool
+        """
+        return not self.errors
+
+
+class DeviceGroup:
+    """
+    A group of devices which are accessed concurrently.
+
+    Proxies are constructed in a thread pool, so the database lookups and connections
+    overlap. Reads are fanned out with asynchronous ``read_attributes`` calls, one per
+    device for all of its attributes, so reading the whole group takes about one
+    round-trip.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        proxy_factory: Callable[[str], Any] = DeviceProxy,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Initialise the DeviceGroup, constructing all proxies concurrently.
+
+        :param names: the device names.
+        :type names: Sequence[str]
+        :param proxy_factory: callable creating a proxy for a device name.
+        :type proxy_factory: Callable[[str], Any]
+        :param max_workers: maximum number of proxies to construct at once, defaults to
+            one per device.
+        :type max_workers: Optional[int]
+        """
+        self.logger = logging.getLogger(__name__)
+        self.names = list(dict.fromkeys(names))
+        with ThreadPoolExecutor(max_workers=max_workers or max(len(self.names), 1)) as pool:
+            self.proxies: Dict[str, Any] = dict(
+                zip(self.names, pool.map(proxy_factory, self.names))
+            )
+
+    def __getitem__(self, name: str) -> Any:
+        """
+        Get the proxy for a device.
+
+        :param name: the device name.
+        :type name: str
+        :return: the device proxy.
+        :rtype: Any
+        """
+        return self.proxies[name]
+
+    def __iter__(self):
+        """
+        Iterate over the device proxies.
+
+        :return: an iterator over the proxies.
+        """
+        return iter(self.proxies.values())
+
+    def __len__(self) -> int:
+        """
+        Get the number of devices in the group.
+
+        :return: the number of devices.
+        :rtype: int
+        """
+        return len(self.proxies)
+
+    def read_attributes(
+        self,
+        attributes: Union[List[str], Mapping[str, List[str]]],
+        timeout_ms: int = DEFAULT_READ_TIMEOUT_MS,
+    ) -> GroupReading:
+        """
+        Read several attributes from several devices in one round-trip.
+
+        :param attributes: attribute names to read from every device, or attribute names
+            keyed by device name.
+        :type attributes: Union[List[str], Mapping[str, List[str]]]
+        :param timeout_ms: maximum time to wait for each reply in milliseconds.
+        :type timeout_ms: int
+        :return: the values read, with errors for attributes which could not be read.
+        :rtype: GroupReading
+        """
+        if not isinstance(attributes, Mapping):
+            attributes = {name: list(attributes) for name in self.names}
+        reading = GroupReading()
+        requests = {}
+        for name, attr_names in attributes.items():
+            reading.values[name] = dict.fromkeys(attr_names)
+            try:
+                requests[name] = self.proxies[name].read_attributes_asynch(attr_names)
+            except DevFailed as df:
+                self._record_device_error(reading, name, attr_names, df)
+        for name, request_id in requests.items():
+            self._collect_reply(reading, name, attributes[name], request_id, timeout_ms)
+        for name, errors in reading.errors.items():
+            self.logger.warning("Failed to read %s from %s: %s", list(errors), name, errors)
+        return reading
+
+    def _collect_reply(
+        self,
+        reading: GroupReading,
+        name: str,
+        attr_names: List[str],
+        request_id: int,
+        timeout_ms: int,
+    ) -> None:
+        try:
+            replies = self.proxies[name].read_attributes_reply(request_id, timeout_ms)
+        except DevFailed as df:
+            self._record_device_error(reading, name, attr_names, df)
+            return
+        for attr_name, reply in zip(attr_names, replies):
+            if reply.has_failed:
+                err_stack = reply.get_err_stack()
+                reading.errors.setdefault(name, {})[attr_name] = (
+                    err_stack[0].desc if err_stack else "read failed"
+                )
+            else:
+                reading.values[name][attr_name] = reply.value
+
+    @staticmethod
+    def _record_device_error(
+        reading: GroupReading, name: str, attr_names: List[str], df: DevFailed
+    ) -> None:
+        reading.errors[name] = dict.fromkeys(attr_names, str(df.args[0].desc))
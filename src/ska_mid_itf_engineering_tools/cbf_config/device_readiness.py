@@ -0,0 +1,201 @@
+"""Wait for Tango devices to reach a target state using event subscriptions."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tango import DevFailed, DevState, EventType
+
+logger = logging.getLogger(__name__)
+
+ADMIN_MODE_ONLINE = 0
+
+
+def subscribe_change_event(proxy: Any, attribute: str, callback: Callable[[Any], None]) -> int:
+    """
+    Subscribe to change events, falling back to periodic events if they are not available.
+
+    :param proxy: the device proxy.
+    :type proxy: Any
+    :param attribute: the attribute name.
+    :type attribute: str
+    :param callback: called with every event received.
+    :type callback: Callable[[Any], None]
+    :return: the event subscription ID.
+    :rtype: int
+    """
+    try:
+        return proxy.subscribe_event(attribute, EventType.CHANGE_EVENT, callback)
+    except DevFailed as df:
+        logger.debug(
+            "No change events for %s/%s, using periodic events: %s",
+            proxy.dev_name(),
+            attribute,
+            df,
+        )
+        return proxy.subscribe_event(attribute, EventType.PERIODIC_EVENT, callback)
+
+
+@dataclass(frozen=True)
+class ReadyCondition:
+    """The State and, optionally, adminMode a device must report to be ready."""
+
+    state: DevState = DevState.OFF
+    admin_mode: Optional[int] = None
+
+    def is_met(self, state: Optional[DevState], admin_mode: Optional[int]) -> bool:
+        """
+        Check whether the condition is met.
+
+        :param state: the latest State of the device, None if not yet received
+        :type state: Optional[DevState]
+        :param admin_mode: the latest adminMode of the device, None if not yet received
+        :type admin_mode: Optional[int]
+        :return: True if the device is ready.
+        :rtype: bool
+        """
+        if state != self.state:
+            return False
+        return self.admin_mode is None or admin_mode == self.admin_mode
+
+
+class DevicesNotReadyError(TimeoutError):
+    """Raised when devices do not become ready before the timeout."""
+
+    def __init__(self, timeout: float, pending: Dict[str, str]) -> None:
+        """
+        Initialise the error with a report of the devices that are not ready.
+
+        :param timeout: the timeout in seconds
+        :type timeout: float
+        :param pending: description of the last known status, keyed by device name
+        :type pending: Dict[str, str]
+        """
+        self.timeout = timeout
+        self.pending = pending
+        report = "\n".join(f"  {name}: {status}" for name, status in pending.items())
+        super().__init__(f"{len(pending)} device(s) not ready after {timeout:.1f} s:\n{report}")
+
+
+class _DeviceStatus:
+    """Latest State and adminMode received for a device."""
+
+    def __init__(self, name: str, condition: ReadyCondition) -> None:
+        self.name = name
+        self.condition = condition
+        self.state: Optional[DevState] = None
+        self.admin_mode: Optional[int] = None
+        self.error: Optional[str] = None
+        self.ready_after: Optional[float] = None
+
+    def describe(self) -> str:
+        admin_mode = "unknown" if self.admin_mode is None else self.admin_mode
+        status = f"State {self.state} (want {self.condition.state}), adminMode {admin_mode}"
+        if self.condition.admin_mode is not None:
+            status += f" (want {self.condition.admin_mode})"
+        return f"{status}; last error: {self.error}" if self.error else status
+
+
+class ReadinessWaiter:
+    """
+    Wait until a set of devices all reach their ready condition.
+
+    Change events are subscribed for State and adminMode on every device, falling back
+    to periodic events where change events are not available. The waiter returns as soon
+    as the last device becomes ready, without polling.
+    """
+
+    ATTRIBUTES = ("State", "adminMode")
+
+    def __init__(self, devices: List[Tuple[Any, ReadyCondition]]) -> None:
+        """
+        Initialise the ReadinessWaiter.
+
+        :param devices: device proxies with the condition each must reach
+        :type devices: List[Tuple[Any, ReadyCondition]]
+        """
+        self.devices = devices
+        self.logger = logging.getLogger(__name__)
+        self._changed = threading.Condition()
+        self._status: Dict[str, _DeviceStatus] = {}
+        self._start = 0.0
+
+    def wait(self, timeout: float) -> Dict[str, float]:
+        """
+        Wait for all devices to become ready.
+
+        :param timeout: maximum time to wait in seconds
+        :type timeout: float
+        :raises DevicesNotReadyError: if the devices are not ready before the timeout.
+        :return: seconds until each device became ready, keyed by device name.
+        :rtype: Dict[str, float]
+        """
+        self._start = time.monotonic()
+        deadline = self._start + timeout
+        self._status = {
+            proxy.dev_name(): _DeviceStatus(proxy.dev_name(), condition)
+            for proxy, condition in self.devices
+        }
+        subscriptions = []
+        try:
+            for proxy, _ in self.devices:
+                for attribute in self.ATTRIBUTES:
+                    subscriptions.append((proxy, self._subscribe(proxy, attribute)))
+            with self._changed:
+                while not self._all_ready():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise DevicesNotReadyError(
+                            timeout,
+                            {
+                                name: status.describe()
+                                for name, status in self._status.items()
+                                if status.ready_after is None
+                            },
+                        )
+                    self._changed.wait(remaining)
+                return {name: status.ready_after for name, status in self._status.items()}
+        finally:
+            for proxy, event_id in subscriptions:
+                try:
+                    proxy.unsubscribe_event(event_id)
+                except DevFailed as df:
+                    self.logger.debug("Failed to unsubscribe from %s: %s", proxy.dev_name(), df)
+
+    def _all_ready(self) -> bool:
+        return all(status.ready_after is not None for status in self._status.values())
+
+    def _subscribe(self, proxy: Any, attribute: str) -> int:
+        name = proxy.dev_name()
+
+        def callback(event: Any) -> None:
+            self._on_event(name, attribute, event)
+
+        return subscribe_change_event(proxy, attribute, callback)
+
+    def _on_event(self, name: str, attribute: str, event: Any) -> None:
+        with self._changed:
+            status = self._status[name]
+            if event.err:
+                status.error = str(event.errors[0].desc) if event.errors else "unknown error"
+                self.logger.debug("Error event from %s/%s: %s", name, attribute, status.error)
+                return
+            value = event.attr_value.value
+            if attribute == "State":
+                status.state = value
+            else:
+                status.admin_mode = int(value)
+            ready = status.condition.is_met(status.state, status.admin_mode)
+            if ready and status.ready_after is None:
+                status.ready_after = time.monotonic() - self._start
+                device_str = f"Device {name}: "
+                state_str = f"State {status.state}; "
+                mode_str = f"Adminmode {status.admin_mode}."
+                self.logger.info(f"{device_str : <42}{state_str : <15}{mode_str : <20}")
+            elif not ready:
+                if status.ready_after is not None:
+                    self.logger.info("%s is no longer ready: %s", name, status.describe())
+                status.ready_after = None
+            self._changed.notify_all()
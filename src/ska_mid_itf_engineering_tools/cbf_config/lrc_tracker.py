@@ -0,0 +1,247 @@
+"""Track SKA long-running commands to completion using change events."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from tango import DevFailed
+
+from .device_readiness import subscribe_change_event
+
+# ska_control_model.ResultCode values which mean the command will not be executed.
+FAILED_RESULT_CODES = {3: "FAILED", 5: "REJECTED", 6: "NOT_ALLOWED", 7: "ABORTED"}
+
+COMPLETED = "COMPLETED"
+FAILED_STATUSES = {"FAILED", "ABORTED", "REJECTED", "NOT_FOUND"}
+
+
+class LongRunningCommandError(RuntimeError):
+    """Raised when a long-running command fails, is rejected or times out."""
+
+    def __init__(self, message: str, outcome: "CommandOutcome") -> None:
+        """
+        Initialise the error.
+
+        :param message: description of the failure.
+        :type message: str
+        :param outcome: the command outcome up to the failure.
+        :type outcome: CommandOutcome
+        """
+        super().__init__(f"{message} ({outcome.summary()})")
+        self.outcome = outcome
+
+
+@dataclass
+class CommandOutcome:
+    """The outcome of a long-running command and the time spent in each status."""
+
+    command: str
+    command_id: Optional[str] = None
+    status: Optional[str] = None
+    result: Optional[str] = None
+    phases: Dict[str, float] = field(default_factory=dict)
+    submitted: float = field(default=0.0, repr=False)
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Get the total time from submitting the command to its last status.
+
+        :return: elapsed time in seconds.
+        :rtype: float
+        """
+        return sum(self.phases.values())
+
+    def summary(self) -> str:
+        """
+        Summarise the command outcome and elapsed time per phase.
+
+        :return: a one-line summary.
+        :rtype: str
+        """
+        phases = ", ".join(f"{phase} {secs:.1f} s" for phase, secs in self.phases.items())
+        return f"{self.command} {self.status or 'UNKNOWN'} after {self.elapsed:.1f} s: {phases}"
+
+
+class LongRunningCommandTracker:
+    """
+    Run long-running commands and wait for them to finish without polling.
+
+    The tracker subscribes to ``longRunningCommandStatus`` and
+    ``longRunningCommandResult`` before a command is submitted, so no status change is
+    missed, and returns the moment the command reaches a final status.
+    """
+
+    def __init__(self, proxy: Any) -> None:
+        """
+        Initialise the LongRunningCommandTracker.
+
+        :param proxy: the device proxy to run commands on.
+        :type proxy: Any
+        """
+        self.proxy = proxy
+        self.logger = logging.getLogger(__name__)
+        self._changed = threading.Condition()
+        self._history: Dict[str, List[Tuple[str, float]]] = {}
+        self._results: Dict[str, str] = {}
+        self._subscriptions: List[int] = []
+
+    def __enter__(self) -> "LongRunningCommandTracker":
+        """
+        Subscribe to the long-running command attributes.
+
+        :return: the tracker.
+        :rtype: LongRunningCommandTracker
+        """
+        self._subscriptions = [
+            subscribe_change_event(self.proxy, "longRunningCommandStatus", self._on_status),
+            subscribe_change_event(self.proxy, "longRunningCommandResult", self._on_result),
+        ]
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """
+        Unsubscribe from the long-running command attributes.
+
+        :param exc: exception details, if any.
+        """
+        for event_id in self._subscriptions:
+            try:
+                self.proxy.unsubscribe_event(event_id)
+            except DevFailed as df:
+                self.logger.debug("Failed to unsubscribe: %s", df)
+        self._subscriptions.clear()
+
+    def run(self, command: str, argin: Any = None, timeout: float = 100) -> CommandOutcome:
+        """
+        Run a long-running command and wait for it to complete.
+
+        :param command: the command name.
+        :type command: str
+        :param argin: the command argument.
+        :type argin: Any
+        :param timeout: maximum time to wait for the command to finish, in seconds.
+        :type timeout: float
+        :raises LongRunningCommandError: if the command is rejected, fails or times out.
+        :return: the command outcome with the time spent in each status.
+        :rtype: CommandOutcome
+        """
+        return self.wait(self.submit(command, argin), timeout)
+
+    def submit(self, command: str, argin: Any = None) -> CommandOutcome:
+        """
+        Submit a long-running command without waiting for it to complete.
+
+        :param command: the command name.
+        :type command: str
+        :param argin: the command argument.
+        :type argin: Any
+        :raises LongRunningCommandError: if the command is rejected.
+        :return: the outcome to pass to :meth:`wait`.
+        :rtype: CommandOutcome
+        """
+        outcome = CommandOutcome(command, submitted=time.monotonic())
+        reply = self.proxy.command_inout(command, argin)
+        outcome.phases["submit"] = time.monotonic() - outcome.submitted
+        result_code, outcome.command_id = self._parse_reply(reply)
+        if result_code in FAILED_RESULT_CODES:
+            outcome.status = FAILED_RESULT_CODES[result_code]
+            raise LongRunningCommandError(f"{command} was not accepted", outcome)
+        return outcome
+
+    def wait(self, outcome: CommandOutcome, timeout: float = 100) -> CommandOutcome:
+        """
+        Wait for a submitted long-running command to complete.
+
+        :param outcome: the outcome returned by :meth:`submit`.
+        :type outcome: CommandOutcome
+        :param timeout: maximum time from submission to completion, in seconds.
+        :type timeout: float
+        :raises LongRunningCommandError: if the command fails or times out.
+        :return: the command outcome with the time spent in each status.
+        :rtype: CommandOutcome
+        """
+        command, submitted = outcome.command, outcome.submitted
+        deadline = submitted + timeout
+        with self._changed:
+            while True:
+                command_id = outcome.command_id or self._latest_id(command, submitted)
+                history = self._history.get(command_id, []) if command_id else []
+                if history and self._is_final(history[-1][0]):
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    outcome.command_id = command_id
+                    self._record_phases(outcome, history, submitted)
+                    raise LongRunningCommandError(
+                        f"{command} timed out after {timeout} s", outcome
+                    )
+                self._changed.wait(remaining)
+            outcome.command_id = command_id
+            outcome.result = self._results.get(command_id)
+            self._record_phases(outcome, history, submitted)
+
+        if outcome.status != COMPLETED:
+            raise LongRunningCommandError(f"{command} finished with {outcome.status}", outcome)
+        self.logger.info(outcome.summary())
+        return outcome
+
+    @staticmethod
+    def _is_final(status: str) -> bool:
+        return status == COMPLETED or status in FAILED_STATUSES
+
+    @staticmethod
+    def _parse_reply(reply: Any) -> Tuple[Optional[int], Optional[str]]:
+        try:
+            return int(reply[0][0]), str(reply[1][0])
+        except (TypeError, IndexError, ValueError):
+            return None, None
+
+    def _latest_id(self, command: str, submitted: float) -> Optional[str]:
+        # Devices which do not return a command ID are tracked by the command name suffix.
+        candidates = [
+            (history[0][1], command_id)
+            for command_id, history in self._history.items()
+            if command_id.endswith(f"_{command}") and history[0][1] >= submitted
+        ]
+        return max(candidates)[1] if candidates else None
+
+    @staticmethod
+    def _record_phases(
+        outcome: CommandOutcome, history: List[Tuple[str, float]], submitted: float
+    ) -> None:
+        # The time in each status runs until the next status is reported.
+        accepted = submitted + outcome.phases["submit"]
+        for (status, start), (_, end) in zip(history, history[1:]):
+            spent = max(0.0, end - max(start, accepted))
+            outcome.phases[status] = outcome.phases.get(status, 0.0) + spent
+        if history:
+            status, start = history[-1]
+            outcome.status = status
+            if not LongRunningCommandTracker._is_final(status):
+                outcome.phases[status] = time.monotonic() - max(start, accepted)
+
+    def _on_status(self, event: Any) -> None:
+        if event.err:
+            self.logger.debug("Error event from %s: %s", self.proxy.dev_name(), event.errors)
+            return
+        now = time.monotonic()
+        value = event.attr_value.value or ()
+        with self._changed:
+            for command_id, status in zip(value[0::2], value[1::2]):
+                history = self._history.setdefault(command_id, [])
+                if not history or history[-1][0] != status:
+                    history.append((status, now))
+            self._changed.notify_all()
+
+    def _on_result(self, event: Any) -> None:
+        if event.err:
+            self.logger.debug("Error event from %s: %s", self.proxy.dev_name(), event.errors)
+            return
+        value = event.attr_value.value
+        if value and len(value) > 1:
+            with self._changed:
+                self._results[value[0]] = value[1]
+                self._changed.notify_all()
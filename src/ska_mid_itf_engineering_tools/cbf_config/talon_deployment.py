@@ -0,0 +1,233 @@
+"""Deploy Talon boards through the EC deployer device as a per-board pipeline."""
+
+import logging
+import queue
+import threading
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from tango import DevFailed
+
+from .lrc_tracker import LongRunningCommandError, LongRunningCommandTracker
+
+DEFAULT_TALONS = [1, 2, 3, 4]
+
+# Deployer commands in the order each board goes through them, with their timeouts in ms.
+STAGES: List[Tuple[str, int]] = [
+    ("generate_config_jsons", 3000),
+    ("download_artifacts", 600000),
+    ("configure_db", 3000),
+]
+
+
+def parse_talons(talons: str) -> List[int]:
+    """
+    Parse a list of Talon board numbers, e.g. from the TARGET_TALONS environment variable.
+
+    :param talons: comma- or space-separated board numbers, e.g. "1,2,3,4"
+    :type talons: str
+    :raises ValueError: if a board number is not a positive integer.
+    :return: the board numbers.
+    :rtype: List[int]
+    """
+    boards = [int(board) for board in talons.replace(",", " ").split()]
+    if not boards or any(board < 1 for board in boards):
+        raise ValueError(f"invalid Talon boards {talons!r}")
+    return boards
+
+
+class TalonDeploymentError(RuntimeError):
+    """Raised when a deployer stage fails for a Talon board."""
+
+    def __init__(self, board: int, stage: str, reason: str) -> None:
+        """
+        Initialise the error.
+
+        :param board: the Talon board number.
+        :type board: int
+        :param stage: the deployer command that failed.
+        :type stage: str
+        :param reason: why it failed.
+        :type reason: str
+        """
+        super().__init__(f"{stage} failed for Talon {board}: {reason}")
+        self.board = board
+        self.stage = stage
+
+
+@dataclass
+class DeploymentReport:
+    """Start and end times of each deployer stage for each Talon board."""
+
+    started: float = field(default_factory=time.monotonic)
+    finished: float = 0.0
+    stages: Dict[int, Dict[str, Tuple[float, float]]] = field(default_factory=dict)
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Get the total deployment time.
+
+        :return: elapsed time in seconds.
+        :rtype: float
+        """
+        return self.finished - self.started
+
+    def durations(self) -> Dict[int, Dict[str, float]]:
+        """
+        Get the duration of each stage for each board.
+
+        :return: stage durations in seconds, keyed by board and stage.
+        :rtype: Dict[int, Dict[str, float]]
+        """
+        return {
+            board: {stage: end - start for stage, (start, end) in stages.items()}
+            for board, stages in self.stages.items()
+        }
+
+    def summary(self) -> str:
+        """
+        Summarise the per-board stage timings.
+
+        :return: a multi-line summary.
+        :rtype: str
+        """
+        lines = [f"Deployed {len(self.stages)} Talon board(s) in {self.elapsed:.1f} s"]
+        for board, durations in self.durations().items():
+            stages = ", ".join(f"{stage} {secs:.1f} s" for stage, secs in durations.items())
+            lines.append(f"  Talon {board}: {stages}")
+        return "\n".join(lines)
+
+
+class TalonDeployment:
+    """
+    Run the EC deployer stages for several Talon boards as a pipeline.
+
+    Each stage runs in its own thread with its own proxy to the deployer. The deployer
+    commands act on the device-wide ``targetTalons``, so writing it and starting a
+    command is done under a lock. If the deployer implements its stages as long-running
+    commands, the boards are captured when the command is queued and the lock is
+    released before waiting for it to finish, so while one board's DB is configured the
+    next board's artifacts are already downloading. Plain commands are run to completion
+    under the lock, one board at a time, as nothing else guarantees they act on the
+    board they were started for.
+    """
+
+    def __init__(
+        self,
+        deployer_factory: Callable[[], Any],
+        talons: Sequence[int] = DEFAULT_TALONS,
+        stages: Sequence[Tuple[str, int]] = STAGES,
+    ) -> None:
+        """
+        Initialise the TalonDeployment.
+
+        :param deployer_factory: callable creating a new proxy to the EC deployer.
+        :type deployer_factory: Callable[[], Any]
+        :param talons: the Talon board numbers to deploy.
+        :type talons: Sequence[int]
+        :param stages: deployer commands with their timeouts in ms, in pipeline order.
+        :type stages: Sequence[Tuple[str, int]]
+        """
+        self.deployer_factory = deployer_factory
+        self.talons = list(talons)
+        self.stages = list(stages)
+        self.logger = logging.getLogger(__name__)
+        self._target_lock = threading.Lock()
+        self._report_lock = threading.Lock()
+        self._failed = threading.Event()
+        self._error: Optional[TalonDeploymentError] = None
+
+    def run(self) -> DeploymentReport:
+        """
+        Deploy all boards.
+
+        :raises TalonDeploymentError: if a stage fails; later boards are not deployed.
+        :return: the per-board stage timings.
+        :rtype: DeploymentReport
+        """
+        report = DeploymentReport()
+        queues: List[queue.Queue] = [queue.Queue() for _ in range(len(self.stages) + 1)]
+        for board in self.talons:
+            queues[0].put(board)
+        queues[0].put(None)
+        workers = [
+            threading.Thread(
+                target=self._run_stage,
+                args=(stage, timeout_ms, queues[i], queues[i + 1], report),
+                name=f"talon-{stage}",
+                daemon=True,
+            )
+            for i, (stage, timeout_ms) in enumerate(self.stages)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        report.finished = time.monotonic()
+        if self._error:
+            raise self._error
+        self.logger.info(report.summary())
+        return report
+
+    def _run_stage(
+        self,
+        stage: str,
+        timeout_ms: int,
+        boards: queue.Queue,
+        done: queue.Queue,
+        report: DeploymentReport,
+    ) -> None:
+        lane = _StageLane(self.deployer_factory)
+        try:
+            while (board := boards.get()) is not None:
+                if self._failed.is_set():
+                    continue
+                try:
+                    start = time.monotonic()
+                    lane.run(stage, board, timeout_ms, self._target_lock)
+                    end = time.monotonic()
+                except (DevFailed, LongRunningCommandError) as err:
+                    reason = str(err.args[0].desc) if isinstance(err, DevFailed) else str(err)
+                    with self._report_lock:
+                        self._error = self._error or TalonDeploymentError(board, stage, reason)
+                    self._failed.set()
+                    continue
+                self.logger.debug(f"{stage} for Talon {board} took {end - start:.1f} s")
+                with self._report_lock:
+                    report.stages.setdefault(board, {})[stage] = (start, end)
+                done.put(board)
+        finally:
+            lane.close()
+            # Always let the next stage finish, even if this one stopped early.
+            done.put(None)
+
+
+class _StageLane:
+    """The deployer proxy, and command tracker if supported, used by one stage thread."""
+
+    def __init__(self, deployer_factory: Callable[[], Any]) -> None:
+        self.deployer_factory = deployer_factory
+        self.deployer: Any = None
+        self.tracker: Optional[LongRunningCommandTracker] = None
+        self._stack = ExitStack()
+
+    def run(self, stage: str, board: int, timeout_ms: int, target_lock: threading.Lock) -> None:
+        if self.deployer is None:
+            self.deployer = self.deployer_factory()
+            if "longRunningCommandStatus" in self.deployer.get_attribute_list():
+                tracker = LongRunningCommandTracker(self.deployer)
+                self.tracker = self._stack.enter_context(tracker)
+        with target_lock:
+            self.deployer.targetTalons = [board]
+            if self.tracker is None:
+                self.deployer.set_timeout_millis(timeout_ms)
+                self.deployer.command_inout(stage)
+                return
+            outcome = self.tracker.submit(stage)
+        self.tracker.wait(outcome, timeout_ms / 1000)
+
+    def close(self) -> None:
+        self._stack.close()
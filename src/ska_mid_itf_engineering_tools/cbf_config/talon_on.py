@@ -10,7 +10,34 @@ from typing import Any
 from ska_ser_logging import configure_logging  # type: ignore
 from tango import DeviceProxy, DevState
 
+from .device_group import DeviceGroup
+from .device_readiness import (
+    ADMIN_MODE_ONLINE,
+    DevicesNotReadyError,
+    ReadinessWaiter,
+    ReadyCondition,
+)
+from .lrc_tracker import LongRunningCommandError, LongRunningCommandTracker
+from .talon_deployment import (
+    DEFAULT_TALONS,
+    TalonDeployment,
+    TalonDeploymentError,
+    parse_talons,
+)
+
 TIMEOUT = 100
+READY_TIMEOUT = 30
+ON_TIMEOUT = TIMEOUT + 20
+CBF_ON_TIMEOUT = 10
+EC_DEPLOYER = "mid_csp_cbf/ec/deployer"
+CSP_CONTROLLER = "mid-csp/control/0"
+CBF_CONTROLLER = "mid_csp_cbf/sub_elt/controller"
+CSP_SUBARRAYS = ["mid-csp/subarray/01", "mid-csp/subarray/02", "mid-csp/subarray/03"]
+CBF_SUBARRAYS = [
+    "mid_csp_cbf/sub_elt/subarray_01",
+    "mid_csp_cbf/sub_elt/subarray_02",
+    "mid_csp_cbf/sub_elt/subarray_03",
+]
 ns = os.environ["KUBE_NAMESPACE"]
 src_pth = os.path.join(os.getcwd(), os.environ["MCS_CONFIG_FILE_PATH"], "hw_config.yaml")
 dest_pth = ns + "/ds-cbfcontroller-controller-0:/app/mnt/hw_config/hw_config.yaml"
@@ -27,9 +54,13 @@ def wait_for_devices(
     cbf_subarray1: Any,
     cbf_subarray2: Any,
     cbf_subarray3: Any,
+    timeout: float = READY_TIMEOUT,
 ) -> None:
     """Wait for Tango Deviceproxies to change states.
 
+    All devices must be OFF, and the CSP and CBF controllers must also be ONLINE.
+    Exits if the devices are not ready before the timeout.
+
     :param cbf : tango.DeviceProxy CBF Controller DeviceProxy
     :param csp : tango.DeviceProxy CSP Controller DeviceProxy
     :param csp_subarray1 : tango.DeviceProxy Subarray DeviceProxy
@@ -38,45 +69,28 @@ def wait_for_devices(
     :param cbf_subarray1 : tango.DeviceProxy Subarray DeviceProxy
     :param cbf_subarray2 : tango.DeviceProxy Subarray DeviceProxy
     :param cbf_subarray3 : tango.DeviceProxy Subarray DeviceProxy
+    :param timeout : maximum time to wait in seconds
     """
-    READY = False
-    timer = 0
-    while not READY:
-        time.sleep(1)
-        timer += 1
-        if timer == 30:
-            break
-        device_proxies = [
-            csp,
-            cbf,
-            cbf_subarray1,
-            cbf_subarray2,
-            cbf_subarray3,
-            csp_subarray1,
-            csp_subarray2,
-            csp_subarray3,
+    controller_ready = ReadyCondition(DevState.OFF, ADMIN_MODE_ONLINE)
+    subarray_ready = ReadyCondition(DevState.OFF)
+    waiter = ReadinessWaiter(
+        [
+            (csp, controller_ready),
+            (cbf, controller_ready),
+            (cbf_subarray1, subarray_ready),
+            (cbf_subarray2, subarray_ready),
+            (cbf_subarray3, subarray_ready),
+            (csp_subarray1, subarray_ready),
+            (csp_subarray2, subarray_ready),
+            (csp_subarray3, subarray_ready),
         ]
-
-        for dp in device_proxies:
-            state = dp.State()
-            server = dp.name()
-            adminmode = dp.adminmode
-            if state != DevState.OFF or (
-                server in ["mid-csp/contro/0", "mid_csp_cbf/sub_elt/controller"] and adminmode != 0
-            ):
-                logger.info(
-                    f"Waiting for {server} to change state from "
-                    f"{state} to OFF while Adminmode is {adminmode.name}"
-                )
-                READY = False
-                break
-            else:
-                READY = True
-                device_str = f"Device {server}: "
-                state_str = f"State {state}; "
-                mode_str = f"Adminmode {adminmode.name}."
-                logger.info(f"{device_str : <42}{state_str : <15}{mode_str : <20}")
-    return
+    )
+    try:
+        ready_after = waiter.wait(timeout)
+    except DevicesNotReadyError as err:
+        logger.error(str(err))
+        sys.exit(1)
+    logger.info(f"All devices ready after {max(ready_after.values()):.1f} seconds")
 
 
 def main() -> None:  # noqa C901
@@ -84,31 +98,34 @@ def main() -> None:  # noqa C901
     logger.debug(f"Path of hw_config.yaml is {src_pth}")
     logger.debug(f"Destination Path of hw_config.yaml is {dest_pth}")
 
-    ec_deployer = DeviceProxy("mid_csp_cbf/ec/deployer")
-
-    ec_deployer.targetTalons = [1, 2, 3, 4]
-    ec_deployer.generate_config_jsons()
-    ec_deployer.set_timeout_millis(600000)
-    ec_deployer.download_artifacts()
-    ec_deployer.configure_db()
-    ec_deployer.set_timeout_millis(3000)
-
-    cbf = DeviceProxy("mid_csp_cbf/sub_elt/controller")
-    csp = DeviceProxy("mid-csp/control/0")
-    csp_subarray1 = DeviceProxy("mid-csp/subarray/01")
-    csp_subarray2 = DeviceProxy("mid-csp/subarray/02")
-    csp_subarray3 = DeviceProxy("mid-csp/subarray/03")
-    cbf_subarray1 = DeviceProxy("mid_csp_cbf/sub_elt/subarray_01")
-    cbf_subarray2 = DeviceProxy("mid_csp_cbf/sub_elt/subarray_02")
-    cbf_subarray3 = DeviceProxy("mid_csp_cbf/sub_elt/subarray_03")
+    devices = DeviceGroup([CBF_CONTROLLER, CSP_CONTROLLER] + CSP_SUBARRAYS + CBF_SUBARRAYS)
+    talons = DEFAULT_TALONS
+    if "TARGET_TALONS" in os.environ:
+        talons = parse_talons(os.environ["TARGET_TALONS"])
+    logger.info(f"Deploying Talon boards {talons}")
+    try:
+        TalonDeployment(lambda: DeviceProxy(EC_DEPLOYER), talons).run()
+    except TalonDeploymentError as err:
+        logger.error(str(err))
+        sys.exit(1)
+
+    cbf = devices[CBF_CONTROLLER]
+    csp = devices[CSP_CONTROLLER]
+    csp_subarray1, csp_subarray2, csp_subarray3 = (devices[name] for name in CSP_SUBARRAYS)
+    cbf_subarray1, cbf_subarray2, cbf_subarray3 = (devices[name] for name in CBF_SUBARRAYS)
 
     if os.environ.get("SWITCH_CSP_ON") == "true":
+        reading = devices.read_attributes(
+            {CSP_CONTROLLER: ["State", "adminMode"], CBF_CONTROLLER: ["simulationMode"]}
+        )
+        csp_state, csp_admin_mode = reading[CSP_CONTROLLER].values()
+        cbf_sim_mode = reading[CBF_CONTROLLER]["simulationMode"]
         # Exit if CSP is already ON
-        if csp.State() == DevState.ON and csp.adminmode == 0 and cbf.simulationMode is False:
+        if csp_state == DevState.ON and csp_admin_mode == 0 and cbf_sim_mode == 0:
             logger.info("CSP is already ON and ONLINE with CBF Simulation mode False")
             return
 
-        if csp.adminmode == 0 and cbf.simulationMode is False:
+        if csp_admin_mode == 0 and cbf_sim_mode != 0:
             # Simulation mode needs to be changed, this requires adminmode to be offline first
             logger.info("Setting CSP adminmode to False")
             csp.adminmode = 1
@@ -161,28 +178,15 @@ def main() -> None:  # noqa C901
         logger.debug(f"Sent set_timeout_millis({TIMEOUT * 1000}) command")
 
         logger.info("Turning CSP ON - this may take a while...")
-        csp.on([])
-        k = 0
-        while k < 10:
-            logger.warning(f"Sleeping for {TIMEOUT-k*10} seconds while CBF is turning on.")
-            time.sleep(10)
-            k += 1
-        k = 1
-        while cbf.State() != DevState.ON:
-            if k == 5:
-                logger.error("Could not turn the CBF Controller on. Exiting.")
-                sys.exit(1)
-
-            def fib(n: int) -> int:
-                return n if n <= 1 else fib(n - 1) + fib(n - 2)
-
-            logger.info(
-                f"Waiting for CBF to change state from {cbf.State()} to ON "
-                "for another {fib(k)} seconds"
-            )
-            time.sleep(fib(k))
-            k += 1
-        logger.info("CBF is ON")
+        try:
+            with LongRunningCommandTracker(csp) as tracker:
+                outcome = tracker.run("On", [], timeout=ON_TIMEOUT)
+            cbf_ready = ReadinessWaiter([(cbf, ReadyCondition(DevState.ON))])
+            cbf_on_after = cbf_ready.wait(CBF_ON_TIMEOUT)[CBF_CONTROLLER]
+        except (LongRunningCommandError, DevicesNotReadyError) as err:
+            logger.error(f"Could not turn the CBF Controller on: {err}")
+            sys.exit(1)
+        logger.info(f"CBF is ON: {outcome.summary()}, CBF ON after another {cbf_on_after:.1f} s")
     return
 
 
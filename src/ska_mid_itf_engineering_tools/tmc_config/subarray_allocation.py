@@ -0,0 +1,184 @@
+"""Partition a pool of DishIDs between TMC sub-arrays."""
+
+import logging
+from typing import Dict, List, Optional, Union
+
+from .tmc_dish_ids import instance
+
+logger = logging.getLogger(__name__)
+
+MAX_SUBARRAYS = 16
+
+SubarraySpec = Dict[int, Union[int, List[str]]]
+
+
+class AllocationError(ValueError):
+    """Raised when a sub-array spec cannot be satisfied from the dish pool."""
+
+
+class SubarrayAllocator:
+    """Allocate dishes from a pool to sub-arrays, each dish to at most one sub-array."""
+
+    def __init__(self, pool: List[str]) -> None:
+        """
+        Initialise the allocator and index the dish pool.
+
+        :param pool: DishIDs available for allocation, in allocation order
+        :raises AllocationError: if the pool contains duplicate DishIDs
+        """
+        self.pool = list(pool)
+        self._index = {dish_id: i for i, dish_id in enumerate(self.pool)}
+        if len(self._index) != len(self.pool):
+            duplicates = sorted({d for d in self.pool if self.pool.count(d) > 1})
+            raise AllocationError(f"duplicate DishIDs in pool: {duplicates}")
+        self._owner: List[Optional[int]] = [None] * len(self.pool)
+        self._allocated: Dict[int, List[str]] = {}
+        self._next_free = 0
+
+    def owner(self, dish_id: str) -> Optional[int]:
+        """
+        Get the sub-array a dish is allocated to.
+
+        :param dish_id: DishID
+        :return: the sub-array ID, or None if the dish is free
+        :raises AllocationError: if the dish is not in the pool
+        """
+        try:
+            return self._owner[self._index[dish_id]]
+        except KeyError:
+            raise AllocationError(f"DishID {dish_id} is not in the pool") from None
+
+    def is_allocated(self, dish_id: str) -> bool:
+        """
+        Check whether a dish is already allocated to a sub-array.
+
+        :param dish_id: DishID
+        :return: True if the dish is allocated
+        """
+        return self.owner(dish_id) is not None
+
+    def allocate(self, subarray_id: int, dish_ids: List[str]) -> List[str]:
+        """
+        Allocate specific dishes to a sub-array.
+
+        Nothing is allocated if any of the dishes is unavailable.
+
+        :param subarray_id: sub-array ID, 1 to MAX_SUBARRAYS
+        :param dish_ids: DishIDs to allocate
+        :return: all DishIDs now allocated to the sub-array
+        :raises AllocationError: if a dish is unknown or already allocated
+        """
+        self._check_subarray_id(subarray_id)
+        for dish_id in dish_ids:
+            owner = self.owner(dish_id)
+            if owner is not None:
+                raise AllocationError(
+                    f"cannot allocate {dish_id} to sub-array {subarray_id}: "
+                    f"already allocated to sub-array {owner}"
+                )
+        if len(set(dish_ids)) != len(dish_ids):
+            raise AllocationError(f"sub-array {subarray_id} requests a DishID twice")
+        for dish_id in dish_ids:
+            self._owner[self._index[dish_id]] = subarray_id
+        allocated = self._allocated.setdefault(subarray_id, [])
+        allocated.extend(dish_ids)
+        return allocated
+
+    def allocate_count(self, subarray_id: int, count: int) -> List[str]:
+        """
+        Allocate the next free dishes from the pool to a sub-array.
+
+        :param subarray_id: sub-array ID, 1 to MAX_SUBARRAYS
+        :param count: number of dishes to allocate
+        :return: all DishIDs now allocated to the sub-array
+        :raises AllocationError: if there are not enough free dishes
+        """
+        self._check_subarray_id(subarray_id)
+        free: List[str] = []
+        position = self._next_free
+        while len(free) < count and position < len(self.pool):
+            if self._owner[position] is None:
+                free.append(self.pool[position])
+            position += 1
+        if len(free) < count:
+            raise AllocationError(
+                f"cannot allocate {count} dishes to sub-array {subarray_id}: "
+                f"only {len(free)} free"
+            )
+        self._next_free = position
+        return self.allocate(subarray_id, free)
+
+    def release(self, subarray_id: int) -> List[str]:
+        """
+        Release all dishes allocated to a sub-array.
+
+        :param subarray_id: sub-array ID
+        :return: the released DishIDs
+        """
+        released = self._allocated.pop(subarray_id, [])
+        for dish_id in released:
+            position = self._index[dish_id]
+            self._owner[position] = None
+            self._next_free = min(self._next_free, position)
+        return released
+
+    def allocation(self) -> Dict[int, List[str]]:
+        """
+        Get the current allocation.
+
+        :return: DishIDs keyed by sub-array ID, sorted by sub-array ID
+        """
+        return {sub_id: list(self._allocated[sub_id]) for sub_id in sorted(self._allocated)}
+
+    @staticmethod
+    def _check_subarray_id(subarray_id: int) -> None:
+        if not 1 <= subarray_id <= MAX_SUBARRAYS:
+            raise AllocationError(f"sub-array ID {subarray_id} out of range 1 to {MAX_SUBARRAYS}")
+
+
+def parse_subarray_spec(spec: str) -> SubarraySpec:
+    """
+    Parse a sub-array spec string, e.g. as set in the SUBARRAY_DISH_IDS environment variable.
+
+    Sub-arrays are separated by semicolons. Each is either ``<id>=<count>`` to allocate
+    the next free dishes, or ``<id>=<DishIDs>`` with space-separated DishIDs, e.g.
+    ``"1=SKA001 SKA036;2=2"``.
+
+    :param spec: sub-array spec string
+    :return: sub-array spec keyed by sub-array ID
+    :raises AllocationError: if the spec cannot be parsed
+    """
+    parsed: SubarraySpec = {}
+    for item in filter(None, (part.strip() for part in spec.split(";"))):
+        sub_id, sep, dishes = item.partition("=")
+        if not sep or not sub_id.strip().isdigit():
+            raise AllocationError(f"invalid sub-array spec {item!r}, expected <id>=<dishes>")
+        dishes = dishes.strip()
+        parsed[int(sub_id)] = int(dishes) if dishes.isdigit() else dishes.split()
+    return parsed
+
+
+def allocate_dishes(pool: List[str], spec: SubarraySpec) -> Dict[int, Dict[str, List[str]]]:
+    """
+    Allocate dishes from a pool to sub-arrays.
+
+    Explicitly listed dishes are allocated before counted allocations, so that counted
+    sub-arrays never take a dish that another sub-array asked for by name.
+
+    :param pool: DishIDs available for allocation
+    :param spec: dish count or list of DishIDs keyed by sub-array ID
+    :return: ``DishIDs`` and dishleafnode ``instances`` keyed by sub-array ID
+    """
+    allocator = SubarrayAllocator(pool)
+    for sub_id, dishes in spec.items():
+        if not isinstance(dishes, int):
+            allocator.allocate(sub_id, dishes)
+    for sub_id, dishes in spec.items():
+        if isinstance(dishes, int):
+            allocator.allocate_count(sub_id, dishes)
+    allocation = allocator.allocation()
+    logger.debug(f"sub-array allocation: {allocation}")
+    return {
+        sub_id: {"DishIDs": dish_ids, "instances": [instance(x) for x in dish_ids]}
+        for sub_id, dish_ids in allocation.items()
+    }
@@ -2,10 +2,12 @@
 
 import logging
 import os
+import sys
 
-from ska_ser_logging import configure_logging  # type: ignore
 from yaml import safe_dump
 
+from .values_schema import ValuesValidationError, validate_values
+
 logger = logging.getLogger(__name__)
 
 
@@ -135,6 +137,7 @@ def tmc_values(
     namespace_prefix: str = "dish-lmc-",
     dish_ids: str = "SKA000",
     namespace_postfix: str = "",
+    subarray_dish_ids: str = "",
 ) -> dict:
     """
     Generate values for the TMC to connect to DishIDs as set in the environment.
@@ -154,12 +157,17 @@ def tmc_values(
     Hostname is being standardised on and may not be a parameter later on. Default
     should be used in production.
 
+    If SUBARRAY_DISH_IDS is set, the DishIDs are partitioned between sub-arrays, e.g.
+    "1=SKA001 SKA036;2=2", and the per-subarray DishIDs and dishleafnode instances are
+    added to the subarraynode values under "subarrays".
+
     :param hostname: TangoDB hostname, defaults to "tango-databaseds"
     :param cluster_domain_postfix: Cluster Domain prefix for each dish, defaults to
         "miditf.internal.skao.int" for MidITF cluster
     :param namespace_prefix: _description_, defaults to "dish-lmc-"
     :param namespace_postfix: _description_, defaults to ""
     :param dish_ids: _description_, defaults to "SKA000"
+    :param subarray_dish_ids: sub-array spec for partitioning the DishIDs, defaults to ""
     :return: dict with values
     """
     if "DISH_IDS" in os.environ:
@@ -172,6 +180,8 @@ def tmc_values(
         namespace_prefix = os.environ["KUBE_NAMESPACE_PREFIX"]
     if "KUBE_NAMESPACE_POSTFIX" in os.environ:
         namespace_postfix = os.environ["KUBE_NAMESPACE_POSTFIX"]
+    if "SUBARRAY_DISH_IDS" in os.environ:
+        subarray_dish_ids = os.environ["SUBARRAY_DISH_IDS"]
     values = {
         "ska-tmc-mid": {
             "deviceServers": {
@@ -192,6 +202,15 @@ def tmc_values(
             },
         }
     }
+    if subarray_dish_ids:
+        from .subarray_allocation import allocate_dishes, parse_subarray_spec
+
+        allocation = allocate_dishes(
+            dish_ids_array_from_str(dish_ids), parse_subarray_spec(subarray_dish_ids)
+        )
+        values["ska-tmc-mid"]["deviceServers"]["subarraynode"]["subarrays"] = {
+            str(sub_id): sub_values for sub_id, sub_values in allocation.items()
+        }
     return values
 
 
@@ -199,9 +218,22 @@ def main() -> None:
     """Create tmc-values.yaml file in $SUT_CHART_DIR folder for TMC to use."""
     assert "SUT_CHART_DIR" in os.environ, "SUT_CHART_DIR environment variable not set"
 
+    # Imported here so that importing this module only pulls in the stdlib and yaml.
+    from ska_ser_logging import configure_logging  # type: ignore
+
     configure_logging(logging.DEBUG)
-    values = tmc_values()
+    try:
+        values = tmc_values()
+    except ValueError as err:
+        logger.error(f"Could not allocate dishes to sub-arrays: {err}")
+        sys.exit(1)
     chart_dir = os.environ["SUT_CHART_DIR"]
+    try:
+        validate_values(values, chart_dir=chart_dir)
+    except ValuesValidationError as err:
+        for error in err.errors:
+            logger.error(f"Invalid TMC values: {error}")
+        sys.exit(1)
     values_file_path = os.path.join(chart_dir, "tmc-values.yaml")
     logger.debug(f"values_file_path: {values_file_path}")
     with open(values_file_path, "w") as file:
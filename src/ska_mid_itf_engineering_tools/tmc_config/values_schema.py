@@ -0,0 +1,317 @@
+"""Validate generated TMC values against the ska-tmc-mid chart values schema."""
+
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from yaml import safe_load
+
+logger = logging.getLogger(__name__)
+
+CHART_NAME = "ska-tmc-mid"
+BUNDLED_SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "ska_tmc_mid.values.schema.json")
+BUNDLED_VERSION = "bundled"
+CACHE_FORMAT = 1
+
+DISH_ID_PATTERN = re.compile(r"^(SKA|MKT)\d{3}$")
+
+_KEYWORDS = (
+    "type",
+    "enum",
+    "const",
+    "pattern",
+    "required",
+    "minItems",
+    "maxItems",
+    "uniqueItems",
+    "minimum",
+    "maximum",
+    "minLength",
+    "maxLength",
+)
+
+_TYPES: Dict[str, Any] = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "null": type(None),
+}
+
+
+class ValuesValidationError(ValueError):
+    """Raised when generated values do not satisfy the chart values schema."""
+
+    def __init__(self, errors: List[str]) -> None:
+        """
+        Initialise the error.
+
+        :param errors: list of human readable validation errors
+        """
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+def check_dish_ids(dish_ids: List[str]) -> List[str]:
+    """
+    Check DishID format and uniqueness.
+
+    :param dish_ids: list of DishIDs
+    :return: list of errors, empty if the DishIDs are valid
+    """
+    errors = [
+        f"invalid DishID {dish_id!r}: expected SKAnnn or MKTnnn"
+        for dish_id in dish_ids
+        if not DISH_ID_PATTERN.match(dish_id)
+    ]
+    seen = set()
+    for dish_id in dish_ids:
+        if dish_id in seen:
+            errors.append(f"duplicate DishID {dish_id!r}")
+        seen.add(dish_id)
+    return errors
+
+
+def compile_schema(schema: dict) -> Dict[str, list]:
+    """
+    Compile a JSON schema into a flat table of checks keyed by generic instance path.
+
+    Local ``$ref`` references are resolved during compilation. Array items share the
+    generic path segment ``*`` so that every element is checked against the same rules.
+
+    :param schema: JSON schema (draft-07 subset)
+    :return: dict mapping generic instance paths to lists of ``[keyword, argument]`` checks
+    """
+    rules: Dict[str, list] = {}
+
+    def resolve(node: dict) -> dict:
+        while "$ref" in node:
+            ref = node["$ref"]
+            if not ref.startswith("#/"):
+                raise ValueError(f"only local $ref is supported, got {ref}")
+            node = schema
+            for part in ref[2:].split("/"):
+                node = node[part]
+        return node
+
+    def visit(node: dict, path: str) -> None:
+        node = resolve(node)
+        checks = rules.setdefault(path, [])
+        checks.extend([keyword, node[keyword]] for keyword in _KEYWORDS if keyword in node)
+        properties = node.get("properties", {})
+        if node.get("additionalProperties") is False:
+            checks.append(["additionalProperties", sorted(properties)])
+        for name, child in properties.items():
+            visit(child, f"{path}/{name}")
+        if isinstance(node.get("items"), dict):
+            visit(node["items"], f"{path}/*")
+
+    visit(schema, "")
+    return {path: checks for path, checks in rules.items() if checks}
+
+
+class CompiledSchema:
+    """A compiled values schema which validates instances in a single pass."""
+
+    def __init__(self, rules: Dict[str, list]) -> None:
+        """
+        Initialise the compiled schema and pre-compile its regular expressions.
+
+        :param rules: compiled rules as returned by :py:func:`compile_schema`
+        """
+        self.rules = rules
+        self._patterns = {
+            arg: re.compile(arg)
+            for checks in rules.values()
+            for keyword, arg in checks
+            if keyword == "pattern"
+        }
+        self._prefixes = {
+            "/".join(path.split("/")[:i]) for path in rules for i in range(path.count("/") + 2)
+        }
+
+    def validate(self, instance: Any) -> List[str]:
+        """
+        Validate an instance against the compiled schema.
+
+        :param instance: the values to validate
+        :return: list of errors, empty if the instance is valid
+        """
+        errors: List[str] = []
+        self._walk(instance, "", "", errors)
+        return errors
+
+    def _walk(self, instance: Any, path: str, location: str, errors: List[str]) -> None:
+        for keyword, arg in self.rules.get(path, ()):
+            error = self._check(keyword, arg, instance)
+            if error:
+                errors.append(f"{location or '/'}: {error}")
+        if isinstance(instance, dict):
+            for key, value in instance.items():
+                child = f"{path}/{key}"
+                if child in self._prefixes:
+                    self._walk(value, child, f"{location}/{key}", errors)
+        elif isinstance(instance, list) and f"{path}/*" in self._prefixes:
+            for index, value in enumerate(instance):
+                self._walk(value, f"{path}/*", f"{location}/{index}", errors)
+
+    def _check(self, keyword: str, arg: Any, instance: Any) -> Optional[str]:  # noqa: C901
+        if keyword == "type":
+            types = arg if isinstance(arg, list) else [arg]
+            matched = any(
+                isinstance(instance, _TYPES[t])
+                and not (isinstance(instance, bool) and t in ("integer", "number"))
+                for t in types
+            )
+            return None if matched else f"expected {' or '.join(types)}, got {instance!r}"
+        if keyword == "enum":
+            return None if instance in arg else f"{instance!r} is not one of {arg}"
+        if keyword == "const":
+            return None if instance == arg else f"expected {arg!r}, got {instance!r}"
+        if isinstance(instance, str):
+            if keyword == "pattern" and not self._patterns[arg].search(instance):
+                return f"{instance!r} does not match {arg!r}"
+            if keyword == "minLength" and len(instance) < arg:
+                return f"{instance!r} is shorter than {arg}"
+            if keyword == "maxLength" and len(instance) > arg:
+                return f"{instance!r} is longer than {arg}"
+        elif isinstance(instance, dict):
+            if keyword == "required":
+                missing = [name for name in arg if name not in instance]
+                return f"missing required properties {missing}" if missing else None
+            if keyword == "additionalProperties":
+                extra = sorted(set(instance) - set(arg))
+                return f"unexpected properties {extra}" if extra else None
+        elif isinstance(instance, list):
+            if keyword == "minItems" and len(instance) < arg:
+                return f"expected at least {arg} items, got {len(instance)}"
+            if keyword == "maxItems" and len(instance) > arg:
+                return f"expected at most {arg} items, got {len(instance)}"
+            if keyword == "uniqueItems" and arg:
+                dumped = [json.dumps(item, sort_keys=True) for item in instance]
+                if len(set(dumped)) != len(dumped):
+                    return "items are not unique"
+        elif isinstance(instance, (int, float)) and not isinstance(instance, bool):
+            if keyword == "minimum" and instance < arg:
+                return f"{instance} is less than {arg}"
+            if keyword == "maximum" and instance > arg:
+                return f"{instance} is greater than {arg}"
+        return None
+
+
+def chart_version(chart_dir: Optional[str]) -> str:
+    """
+    Get the ska-tmc-mid chart version that the SUT chart depends on.
+
+    :param chart_dir: directory containing the SUT Chart.yaml
+    :return: the dependency version, or "bundled" if it cannot be determined
+    """
+    if not chart_dir:
+        return BUNDLED_VERSION
+    chart_file = os.path.join(chart_dir, "Chart.yaml")
+    if not os.path.isfile(chart_file):
+        return BUNDLED_VERSION
+    with open(chart_file, encoding="utf-8") as file:
+        chart = safe_load(file) or {}
+    for dependency in chart.get("dependencies") or []:
+        if dependency.get("name") == CHART_NAME and dependency.get("version"):
+            return str(dependency["version"])
+    return BUNDLED_VERSION
+
+
+def schema_path(chart_dir: Optional[str]) -> str:
+    """
+    Find the values schema: the unpacked ska-tmc-mid subchart, or the bundled copy.
+
+    :param chart_dir: directory containing the SUT Chart.yaml
+    :return: path of the values schema
+    """
+    if chart_dir:
+        chart_schema = os.path.join(chart_dir, "charts", CHART_NAME, "values.schema.json")
+        if os.path.isfile(chart_schema):
+            return chart_schema
+    return BUNDLED_SCHEMA_PATH
+
+
+def default_cache_dir() -> str:
+    """
+    Get the directory in which compiled schemas are cached.
+
+    :return: the cache directory
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_home, "ska-mid-itf-engineering-tools")
+
+
+def load_compiled_schema(
+    version: str = BUNDLED_VERSION,
+    path: str = BUNDLED_SCHEMA_PATH,
+    cache_dir: Optional[str] = None,
+) -> CompiledSchema:
+    """
+    Load the compiled schema for a chart version, compiling and caching it if needed.
+
+    :param version: ska-tmc-mid chart version used as cache key
+    :param path: path of the values schema to compile on a cache miss
+    :param cache_dir: directory for compiled schemas, defaults to the user cache directory
+    :return: the compiled schema
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    safe_version = re.sub(r"[^A-Za-z0-9._-]", "_", version)
+    cache_file = os.path.join(cache_dir, f"{CHART_NAME}-{safe_version}.compiled.json")
+    try:
+        with open(cache_file, encoding="utf-8") as file:
+            cached = json.load(file)
+        if cached.get("format") == CACHE_FORMAT:
+            logger.debug(f"Using compiled schema {cache_file}")
+            return CompiledSchema(cached["rules"])
+    except (OSError, ValueError, KeyError) as err:
+        logger.debug(f"No usable compiled schema at {cache_file}: {err}")
+
+    logger.debug(f"Compiling values schema {path} for {CHART_NAME} {version}")
+    with open(path, encoding="utf-8") as file:
+        rules = compile_schema(json.load(file))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as file:
+            json.dump({"format": CACHE_FORMAT, "version": version, "rules": rules}, file)
+        os.replace(tmp_file, cache_file)
+    except OSError as err:
+        logger.warning(f"Could not cache compiled schema at {cache_file}: {err}")
+    return CompiledSchema(rules)
+
+
+def validate_values(
+    values: dict, chart_dir: Optional[str] = None, cache_dir: Optional[str] = None
+) -> None:
+    """
+    Validate generated TMC values before they are handed to Helm.
+
+    DishIDs are checked for format and uniqueness first, then the ska-tmc-mid values are
+    validated against the chart values schema.
+
+    :param values: values as generated by tmc_values()
+    :param chart_dir: directory containing the SUT Chart.yaml, defaults to None
+    :param cache_dir: directory for compiled schemas, defaults to the user cache directory
+    :raises ValuesValidationError: if the values are not valid
+    """
+    chart_values = values.get(CHART_NAME, {})
+    device_servers = chart_values.get("deviceServers", {})
+    errors = []
+    for server in ("centralnode", "subarraynode"):
+        dish_ids = device_servers.get(server, {}).get("DishIDs", [])
+        errors += [f"{server}: {error}" for error in check_dish_ids(dish_ids)]
+    if errors:
+        raise ValuesValidationError(errors)
+
+    schema = load_compiled_schema(
+        chart_version(chart_dir), schema_path(chart_dir), cache_dir=cache_dir
+    )
+    errors = schema.validate(chart_values)
+    if errors:
+        raise ValuesValidationError(errors)
@@ -0,0 +1 @@
+"""Tests for the CBF configuration tooling."""
@@ -0,0 +1,259 @@
+"""Simulated CSP/CBF devices for testing the CBF bring-up tooling."""
+
+import threading
+import time
+from typing import List, Tuple
+
+from tango import AttrWriteType, DevState, EnsureOmniThread
+from tango.server import Device, attribute, command, device_property
+
+
+class SimulatedDevice(Device):
+    """A device which switches OFF some time after its adminMode is set to ONLINE."""
+
+    transition_delay = device_property(dtype=float, default_value=0.0)
+
+    def init_device(self) -> None:
+        """Initialise the device as DISABLE and OFFLINE."""
+        super().init_device()
+        self._admin_mode = 1
+        self.set_state(DevState.DISABLE)
+        self.set_change_event("State", True, False)
+        self.set_change_event("adminMode", True, False)
+
+    @attribute(dtype=int, access=AttrWriteType.READ_WRITE)
+    def adminMode(self) -> int:
+        """
+        Get the adminMode.
+
+        :return: the adminMode
+        """
+        return self._admin_mode
+
+    @adminMode.write
+    def adminMode(self, value: int) -> None:
+        """
+        Set the adminMode, switching OFF after transition_delay if set to ONLINE.
+
+        :param value: the new adminMode
+        """
+        self._admin_mode = value
+        self.push_change_event("adminMode", value)
+        if value == 0:
+            timer = threading.Timer(self.transition_delay, self._switch_off)
+            timer.daemon = True
+            timer.start()
+
+    def _switch_off(self) -> None:
+        with EnsureOmniThread():
+            self.set_state(DevState.OFF)
+            self.push_change_event("State", DevState.OFF)
+
+
+class SimulatedController(SimulatedDevice):
+    """A device with an On long-running command which takes command_duration seconds."""
+
+    command_duration = device_property(dtype=float, default_value=0.0)
+    command_status = device_property(dtype=str, default_value="COMPLETED")
+
+    def init_device(self) -> None:
+        """Initialise the device with an empty long-running command status."""
+        super().init_device()
+        self._lrc_status: List[str] = []
+        self._lrc_result: List[str] = ["", ""]
+        self._commands = 0
+        self.set_change_event("longRunningCommandStatus", True, False)
+        self.set_change_event("longRunningCommandResult", True, False)
+
+    @attribute(dtype=(str,), max_dim_x=100)
+    def longRunningCommandStatus(self) -> List[str]:
+        """
+        Get the status of the long-running commands as (ID, status) pairs.
+
+        :return: the command statuses
+        """
+        return self._lrc_status
+
+    @attribute(dtype=(str,), max_dim_x=2)
+    def longRunningCommandResult(self) -> List[str]:
+        """
+        Get the result of the last long-running command as (ID, result).
+
+        :return: the command result
+        """
+        return self._lrc_result
+
+    @command(dtype_in=(str,), dtype_out="DevVarLongStringArray")
+    def On(self, _argin: List[str]) -> Tuple[List[int], List[str]]:
+        """
+        Queue the On command.
+
+        :param _argin: unused
+        :return: the QUEUED result code and the command ID
+        """
+        self._commands += 1
+        command_id = f"{time.time()}_{self._commands}_On"
+        self._set_status(command_id, "QUEUED")
+        timer = threading.Timer(0.05, self._execute, args=(command_id,))
+        timer.daemon = True
+        timer.start()
+        return [2], [command_id]
+
+    def _execute(self, command_id: str) -> None:
+        with EnsureOmniThread():
+            self._set_status(command_id, "IN_PROGRESS")
+            time.sleep(self.command_duration)
+            if self.command_status == "COMPLETED":
+                self.set_state(DevState.ON)
+                self.push_change_event("State", DevState.ON)
+            self._lrc_result = [command_id, f'[0, "On {self.command_status}"]']
+            self.push_change_event("longRunningCommandResult", self._lrc_result)
+            self._set_status(command_id, self.command_status)
+
+    def _set_status(self, command_id: str, status: str) -> None:
+        self._lrc_status = [command_id, status]
+        self.push_change_event("longRunningCommandStatus", self._lrc_status)
+
+
+class SimulatedDeployer(Device):
+    """A stand-in EC deployer which records the boards each command was run for."""
+
+    stage_delay = device_property(dtype=float, default_value=0.1)
+    failing_board = device_property(dtype=int, default_value=0)
+
+    def init_device(self) -> None:
+        """Initialise the deployer with no target boards."""
+        super().init_device()
+        self._target_talons: List[int] = []
+        self._calls: List[str] = []
+        self._lock = threading.Lock()
+
+    @attribute(dtype=(int,), max_dim_x=32, access=AttrWriteType.READ_WRITE)
+    def targetTalons(self) -> List[int]:
+        """
+        Get the boards the next command is run for.
+
+        :return: the Talon board numbers
+        """
+        return self._target_talons
+
+    @targetTalons.write
+    def targetTalons(self, value: List[int]) -> None:
+        """
+        Set the boards the next command is run for.
+
+        :param value: the Talon board numbers
+        """
+        self._target_talons = list(value)
+
+    @attribute(dtype=(str,), max_dim_x=1000)
+    def calls(self) -> List[str]:
+        """
+        Get the commands run so far as "<command> <board> <start> <end>".
+
+        :return: the recorded calls
+        """
+        return self._calls
+
+    def _run(self, stage: str, boards: List[int]) -> None:
+        start = time.monotonic()
+        if self.failing_board in boards and stage == "download_artifacts":
+            raise RuntimeError(f"download failed for {boards}")
+        time.sleep(self.stage_delay)
+        with self._lock:
+            self._calls.extend(f"{stage} {board} {start} {time.monotonic()}" for board in boards)
+
+    @command
+    def generate_config_jsons(self) -> None:
+        """Generate the configuration for the target boards."""
+        self._run("generate_config_jsons", self._target_talons)
+
+    @command
+    def download_artifacts(self) -> None:
+        """Download the artifacts for the target boards."""
+        self._run("download_artifacts", self._target_talons)
+
+    @command
+    def configure_db(self) -> None:
+        """Configure the Tango DB for the target boards."""
+        self._run("configure_db", self._target_talons)
+
+
+class SimulatedLrcDeployer(SimulatedDeployer):
+    """A stand-in EC deployer whose stages are long-running commands."""
+
+    def init_device(self) -> None:
+        """Initialise the deployer with an empty long-running command status."""
+        super().init_device()
+        self._lrc_status: List[str] = []
+        self._commands = 0
+        self.set_change_event("longRunningCommandStatus", True, False)
+        self.set_change_event("longRunningCommandResult", True, False)
+
+    @attribute(dtype=(str,), max_dim_x=100)
+    def longRunningCommandStatus(self) -> List[str]:
+        """
+        Get the status of the long-running commands as (ID, status) pairs.
+
+        :return: the command statuses
+        """
+        return self._lrc_status
+
+    @attribute(dtype=(str,), max_dim_x=2)
+    def longRunningCommandResult(self) -> List[str]:
+        """
+        Get the result of the last long-running command as (ID, result).
+
+        :return: the command result
+        """
+        return ["", ""]
+
+    def _queue(self, stage: str) -> Tuple[List[int], List[str]]:
+        self._commands += 1
+        command_id = f"{time.time()}_{self._commands}_{stage}"
+        thread = threading.Thread(
+            target=self._execute, args=(command_id, stage, list(self._target_talons))
+        )
+        thread.daemon = True
+        thread.start()
+        return [2], [command_id]
+
+    def _execute(self, command_id: str, stage: str, boards: List[int]) -> None:
+        with EnsureOmniThread():
+            status = "COMPLETED"
+            try:
+                self._run(stage, boards)
+            except RuntimeError:
+                status = "FAILED"
+            with self._lock:
+                statuses = dict(zip(self._lrc_status[0::2], self._lrc_status[1::2]))
+                statuses[command_id] = status
+                self._lrc_status = [item for pair in statuses.items() for item in pair]
+                self.push_change_event("longRunningCommandStatus", self._lrc_status)
+
+    @command(dtype_out="DevVarLongStringArray")
+    def generate_config_jsons(self) -> Tuple[List[int], List[str]]:
+        """
+        Queue generating the configuration for the target boards.
+
+        :return: the QUEUED result code and the command ID
+        """
+        return self._queue("generate_config_jsons")
+
+    @command(dtype_out="DevVarLongStringArray")
+    def download_artifacts(self) -> Tuple[List[int], List[str]]:
+        """
+        Queue downloading the artifacts for the target boards.
+
+        :return: the QUEUED result code and the command ID
+        """
+        return self._queue("download_artifacts")
+
+    @command(dtype_out="DevVarLongStringArray")
+    def configure_db(self) -> Tuple[List[int], List[str]]:
+        """
+        Queue configuring the Tango DB for the target boards.
+
+        :return: the QUEUED result code and the command ID
+        """
+        return self._queue("configure_db")
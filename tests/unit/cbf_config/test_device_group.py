@@ -0,0 +1,75 @@
+"""Tests for the concurrent device group."""
+
+import time
+from typing import Any, Generator
+
+import pytest
+from tango import DevState
+from tango.test_context import MultiDeviceTestContext
+
+from ska_mid_itf_engineering_tools.cbf_config.device_group import DeviceGroup
+
+from .simulated_devices import SimulatedDevice
+
+NAMES = ["mid-csp/control/0", "mid-csp/subarray/01", "mid-csp/subarray/02"]
+
+
+@pytest.fixture(name="context", scope="module")
+def fixture_context() -> Generator[MultiDeviceTestContext, None, None]:
+    """
+    Start simulated devices.
+
+    :yield: the running test context.
+    :rtype: Generator[MultiDeviceTestContext, None, None]
+    """
+    devices = [{"name": name} for name in NAMES]
+    with MultiDeviceTestContext(
+        [{"class": SimulatedDevice, "devices": devices}], process=True
+    ) as context:
+        yield context
+
+
+def test_proxies_are_constructed_concurrently():
+    """Assert that slow proxy construction overlaps across devices."""
+
+    def slow_factory(name: str) -> Any:
+        time.sleep(0.2)
+        return name
+
+    names = [f"mid-csp/subarray/{i:02d}" for i in range(1, 9)]
+    start = time.monotonic()
+    group = DeviceGroup(names, proxy_factory=slow_factory)
+    assert time.monotonic() - start < 0.2 * len(names) / 2
+    assert list(group) == names
+    assert group["mid-csp/subarray/03"] == "mid-csp/subarray/03"
+
+
+def test_read_attributes(context: MultiDeviceTestContext):
+    """
+    Assert that several attributes are read from every device.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    """
+    group = DeviceGroup(NAMES, proxy_factory=context.get_device)
+    reading = group.read_attributes(["State", "adminMode"])
+    assert reading.ok
+    assert reading.values == {name: {"State": DevState.DISABLE, "adminMode": 1} for name in NAMES}
+
+
+def test_read_attributes_reports_errors(context: MultiDeviceTestContext):
+    """
+    Assert that attributes which cannot be read are reported without failing the group.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    """
+    group = DeviceGroup(NAMES, proxy_factory=context.get_device)
+    reading = group.read_attributes(
+        {NAMES[0]: ["State", "simulationMode"], NAMES[1]: ["adminMode"]}
+    )
+    assert not reading.ok
+    assert reading[NAMES[0]] == {"State": DevState.DISABLE, "simulationMode": None}
+    assert reading[NAMES[1]] == {"adminMode": 1}
+    assert list(reading.errors) == [NAMES[0]]
+    assert list(reading.errors[NAMES[0]]) == ["simulationMode"]
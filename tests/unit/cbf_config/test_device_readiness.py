@@ -0,0 +1,73 @@
+"""Tests for the event-driven device readiness waiter."""
+
+import time
+from typing import Generator
+
+import pytest
+from tango.test_context import MultiDeviceTestContext
+
+from ska_mid_itf_engineering_tools.cbf_config.device_readiness import (
+    ADMIN_MODE_ONLINE,
+    DevicesNotReadyError,
+    ReadinessWaiter,
+    ReadyCondition,
+)
+
+from .simulated_devices import SimulatedDevice
+
+CONTROLLER = "mid-csp/control/0"
+SUBARRAYS = ["mid-csp/subarray/01", "mid-csp/subarray/02"]
+STUCK = "mid-csp/subarray/03"
+
+
+@pytest.fixture(name="context", scope="module")
+def fixture_context() -> Generator[MultiDeviceTestContext, None, None]:
+    """
+    Start simulated devices; the last subarray never switches OFF within the tests.
+
+    :yield: the running test context.
+    :rtype: Generator[MultiDeviceTestContext, None, None]
+    """
+    devices = [{"name": name, "properties": {"transition_delay": 0.2}} for name in SUBARRAYS]
+    devices.append({"name": CONTROLLER, "properties": {"transition_delay": 0.5}})
+    devices.append({"name": STUCK, "properties": {"transition_delay": 3600}})
+    with MultiDeviceTestContext(
+        [{"class": SimulatedDevice, "devices": devices}], process=True
+    ) as context:
+        for name in SUBARRAYS + [CONTROLLER, STUCK]:
+            context.get_device(name).adminMode = ADMIN_MODE_ONLINE
+        yield context
+
+
+def test_waiter_returns_when_devices_are_ready(context: MultiDeviceTestContext):
+    """
+    Assert that the waiter returns as soon as the last device is ready.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    """
+    devices = [(context.get_device(name), ReadyCondition()) for name in SUBARRAYS]
+    devices.append((context.get_device(CONTROLLER), ReadyCondition(admin_mode=ADMIN_MODE_ONLINE)))
+    start = time.monotonic()
+    ready_after = ReadinessWaiter(devices).wait(timeout=10)
+    assert time.monotonic() - start < 5
+    assert sorted(ready_after) == sorted(SUBARRAYS + [CONTROLLER])
+
+
+def test_waiter_reports_devices_which_are_not_ready(context: MultiDeviceTestContext):
+    """
+    Assert that a timeout reports only the devices which did not become ready.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    """
+    devices = [
+        (context.get_device(SUBARRAYS[0]), ReadyCondition()),
+        (context.get_device(STUCK), ReadyCondition()),
+    ]
+    start = time.monotonic()
+    with pytest.raises(DevicesNotReadyError) as err:
+        ReadinessWaiter(devices).wait(timeout=1)
+    assert 1 <= time.monotonic() - start < 5
+    assert list(err.value.pending) == [STUCK]
+    assert "State DISABLE (want OFF)" in str(err.value)
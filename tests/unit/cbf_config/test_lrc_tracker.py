@@ -0,0 +1,83 @@
+"""Tests for the long-running command tracker."""
+
+import time
+from typing import Generator
+
+import pytest
+from tango import DevState
+from tango.test_context import MultiDeviceTestContext
+
+from ska_mid_itf_engineering_tools.cbf_config.lrc_tracker import (
+    LongRunningCommandError,
+    LongRunningCommandTracker,
+)
+
+from .simulated_devices import SimulatedController
+
+FAST = "mid-csp/control/0"
+FAILING = "mid-csp/control/1"
+SLOW = "mid-csp/control/2"
+
+
+@pytest.fixture(name="context", scope="module")
+def fixture_context() -> Generator[MultiDeviceTestContext, None, None]:
+    """
+    Start simulated controllers with different On command behaviour.
+
+    :yield: the running test context.
+    :rtype: Generator[MultiDeviceTestContext, None, None]
+    """
+    devices = [
+        {"name": FAST, "properties": {"command_duration": 0.5}},
+        {"name": FAILING, "properties": {"command_status": "FAILED"}},
+        {"name": SLOW, "properties": {"command_duration": 60}},
+    ]
+    with MultiDeviceTestContext(
+        [{"class": SimulatedController, "devices": devices}], process=True
+    ) as context:
+        yield context
+
+
+def test_returns_when_command_completes(context: MultiDeviceTestContext):
+    """
+    Assert that the tracker returns as soon as the command completes.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    """
+    proxy = context.get_device(FAST)
+    start = time.monotonic()
+    with LongRunningCommandTracker(proxy) as tracker:
+        outcome = tracker.run("On", [], timeout=10)
+    assert time.monotonic() - start < 3
+    assert outcome.status == "COMPLETED"
+    assert outcome.command_id.endswith("_On")
+    assert outcome.result == '[0, "On COMPLETED"]'
+    assert list(outcome.phases) == ["submit", "QUEUED", "IN_PROGRESS"]
+    assert outcome.phases["IN_PROGRESS"] >= 0.4
+    assert proxy.State() == DevState.ON
+
+
+def test_raises_when_command_fails(context: MultiDeviceTestContext):
+    """
+    Assert that a failed command is reported immediately.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    """
+    with LongRunningCommandTracker(context.get_device(FAILING)) as tracker:
+        with pytest.raises(LongRunningCommandError, match="On finished with FAILED"):
+            tracker.run("On", [], timeout=10)
+
+
+def test_raises_on_timeout(context: MultiDeviceTestContext):
+    """
+    Assert that a command which does not finish in time is reported with its last status.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    """
+    with LongRunningCommandTracker(context.get_device(SLOW)) as tracker:
+        with pytest.raises(LongRunningCommandError, match="timed out") as err:
+            tracker.run("On", [], timeout=1)
+    assert err.value.outcome.status == "IN_PROGRESS"
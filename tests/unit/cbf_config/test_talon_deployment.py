@@ -0,0 +1,141 @@
+"""Tests for the pipelined Talon board deployment."""
+
+from typing import Dict, Generator, List, Tuple
+
+import pytest
+from tango.test_context import MultiDeviceTestContext
+
+from ska_mid_itf_engineering_tools.cbf_config.talon_deployment import (
+    STAGES,
+    TalonDeployment,
+    TalonDeploymentError,
+    parse_talons,
+)
+
+from .simulated_devices import SimulatedDeployer, SimulatedLrcDeployer
+
+DEPLOYER = "mid_csp_cbf/ec/deployer"
+FAILING_DEPLOYER = "mid_csp_cbf/ec/deployer_2"
+LRC_DEPLOYER = "mid_csp_cbf/ec/deployer_3"
+FAILING_LRC_DEPLOYER = "mid_csp_cbf/ec/deployer_4"
+STAGE_DELAY = 0.3
+
+
+@pytest.fixture(name="context")
+def fixture_context() -> Generator[MultiDeviceTestContext, None, None]:
+    """
+    Start stand-in deployers with plain and long-running commands.
+
+    One of each fails to download the artifacts for board 2.
+
+    :yield: the running test context.
+    :rtype: Generator[MultiDeviceTestContext, None, None]
+    """
+    devices_info = [
+        {
+            "class": device_class,
+            "devices": [
+                {"name": name, "properties": {"stage_delay": STAGE_DELAY}},
+                {"name": failing_name, "properties": {"failing_board": 2}},
+            ],
+        }
+        for device_class, name, failing_name in [
+            (SimulatedDeployer, DEPLOYER, FAILING_DEPLOYER),
+            (SimulatedLrcDeployer, LRC_DEPLOYER, FAILING_LRC_DEPLOYER),
+        ]
+    ]
+    with MultiDeviceTestContext(devices_info, process=True) as context:
+        yield context
+
+
+def recorded_calls(context: MultiDeviceTestContext, name: str) -> Dict[Tuple[str, int], float]:
+    """
+    Get the start time of each command the deployer ran, keyed by command and board.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    :param name: the deployer device name.
+    :type name: str
+    :return: command start times.
+    :rtype: Dict[Tuple[str, int], float]
+    """
+    calls = {}
+    for call in context.get_device(name).calls or []:
+        stage, board, start, _end = call.split()
+        calls[(stage, int(board))] = float(start)
+    return calls
+
+
+def test_parse_talons():
+    """Assert that board lists are parsed from the environment format."""
+    assert parse_talons("1,2, 3 4") == [1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        parse_talons("0")
+
+
+def assert_all_stages_ran(context: MultiDeviceTestContext, name: str, talons: List[int]):
+    """
+    Assert that every stage ran exactly once for each board, in pipeline order.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    :param name: the deployer device name.
+    :type name: str
+    :param talons: the boards deployed.
+    :type talons: List[int]
+    """
+    stages = [stage for stage, _ in STAGES]
+    calls = recorded_calls(context, name)
+    assert sorted(calls) == sorted((stage, board) for stage in stages for board in talons)
+    for board in talons:
+        starts = [calls[(stage, board)] for stage in stages]
+        assert starts == sorted(starts)
+
+
+def test_plain_commands_are_run_one_board_at_a_time(context: MultiDeviceTestContext):
+    """
+    Assert that plain deployer commands each act on the board they were started for.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    """
+    talons = [1, 2, 3]
+    report = TalonDeployment(lambda: context.get_device(DEPLOYER), talons).run()
+    assert list(report.durations()) == talons
+    assert all(
+        list(durations) == [s for s, _ in STAGES] for durations in report.durations().values()
+    )
+    assert_all_stages_ran(context, DEPLOYER, talons)
+
+
+def test_long_running_commands_are_pipelined(context: MultiDeviceTestContext):
+    """
+    Assert that long-running deployer stages overlap across boards.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    """
+    talons = [1, 2, 3, 4]
+    report = TalonDeployment(lambda: context.get_device(LRC_DEPLOYER), talons).run()
+    assert list(report.durations()) == talons
+    # One board after another this takes 12 stage delays; pipelined it takes about 6.
+    assert report.elapsed < len(talons) * len(STAGES) * STAGE_DELAY * 0.75
+    assert_all_stages_ran(context, LRC_DEPLOYER, talons)
+
+
+@pytest.mark.parametrize("name", [FAILING_DEPLOYER, FAILING_LRC_DEPLOYER])
+def test_failed_stage_stops_later_boards(context: MultiDeviceTestContext, name: str):
+    """
+    Assert that a failing stage is reported and later boards are not deployed.
+
+    :param context: the running test context.
+    :type context: MultiDeviceTestContext
+    :param name: the deployer device name.
+    :type name: str
+    """
+    deployment = TalonDeployment(lambda: context.get_device(name), [1, 2, 3])
+    with pytest.raises(TalonDeploymentError, match="download_artifacts failed for Talon 2"):
+        deployment.run()
+    calls = recorded_calls(context, name)
+    assert ("configure_db", 1) in calls
+    assert ("download_artifacts", 3) not in calls
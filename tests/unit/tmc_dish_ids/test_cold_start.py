@@ -0,0 +1,65 @@
+"""Tests for the cold-start import cost of tmc_dish_ids."""
+
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+MODULE = "ska_mid_itf_engineering_tools.tmc_config.tmc_dish_ids"
+
+# Cumulative import time budget in microseconds for the CLI module and everything it pulls in.
+IMPORT_BUDGET_US = 250_000
+
+HEAVY_MODULES = ["tango", "ska_ser_logging", "ska_ser_skallop", "casacore", "git", "numpy"]
+
+
+@pytest.fixture(name="import_times")
+def fixture_import_times() -> Dict[str, int]:
+    """
+    Import the module in a fresh interpreter with -X importtime.
+
+    :return: Cumulative import time in microseconds, keyed by module name.
+    :rtype: Dict[str, int]
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, ["src", env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+def test_cli_module_does_not_import_heavy_dependencies(import_times: Dict[str, int]):
+    """
+    Assert that importing the CLI module only loads the stdlib and yaml.
+
+    :param import_times: Cumulative import times keyed by module name.
+    :type import_times: Dict[str, int]
+    """
+    loaded = {name.split(".")[0] for name in import_times}
+    heavy = [name for name in HEAVY_MODULES if name in loaded]
+    assert not heavy, f"heavy modules imported at startup: {heavy}"
+
+
+def test_cli_module_import_within_budget(import_times: Dict[str, int]):
+    """
+    Assert that the cold-start import of the CLI module stays within the budget.
+
+    :param import_times: Cumulative import times keyed by module name.
+    :type import_times: Dict[str, int]
+    """
+    packages = [".".join(MODULE.split(".")[: i + 1]) for i in range(MODULE.count(".") + 1)]
+    total = sum(import_times[name] for name in packages)
+    assert total < IMPORT_BUDGET_US, f"cold-start import took {total} us"
@@ -0,0 +1,80 @@
+"""Tests for partitioning DishIDs between sub-arrays."""
+
+import pytest
+
+from ska_mid_itf_engineering_tools.tmc_config.subarray_allocation import (
+    AllocationError,
+    SubarrayAllocator,
+    allocate_dishes,
+    parse_subarray_spec,
+)
+from ska_mid_itf_engineering_tools.tmc_config.tmc_dish_ids import tmc_values
+
+# 133 SKA dishes and 64 MeerKAT dishes.
+MID_ARRAY = [f"SKA{i:03d}" for i in range(1, 134)] + [f"MKT{i:03d}" for i in range(64)]
+
+
+def test_parse_subarray_spec():
+    """Assert that counts and explicit DishID lists are parsed."""
+    assert parse_subarray_spec("1=SKA001 SKA036; 2=2;") == {1: ["SKA001", "SKA036"], 2: 2}
+    with pytest.raises(AllocationError):
+        parse_subarray_spec("one=SKA001")
+
+
+def test_explicit_dishes_are_allocated_before_counts():
+    """Assert that counted allocations skip dishes requested by name."""
+    allocation = allocate_dishes(["SKA001", "SKA036", "SKA063", "SKA100"], {1: 2, 2: ["SKA001"]})
+    assert allocation == {
+        1: {"DishIDs": ["SKA036", "SKA063"], "instances": ["036", "063"]},
+        2: {"DishIDs": ["SKA001"], "instances": ["001"]},
+    }
+
+
+def test_dish_cannot_be_allocated_twice():
+    """Assert that a dish already allocated to one sub-array is rejected for another."""
+    allocator = SubarrayAllocator(["SKA001", "SKA036"])
+    allocator.allocate(1, ["SKA001"])
+    assert allocator.is_allocated("SKA001")
+    assert not allocator.is_allocated("SKA036")
+    with pytest.raises(AllocationError, match="already allocated to sub-array 1"):
+        allocator.allocate(2, ["SKA036", "SKA001"])
+    assert not allocator.is_allocated("SKA036")
+    with pytest.raises(AllocationError, match="not in the pool"):
+        allocator.allocate(2, ["SKA002"])
+
+
+def test_release_returns_dishes_to_pool():
+    """Assert that released dishes can be allocated again."""
+    allocator = SubarrayAllocator(["SKA001", "SKA036", "SKA063"])
+    allocator.allocate_count(1, 2)
+    allocator.allocate_count(2, 1)
+    assert allocator.release(1) == ["SKA001", "SKA036"]
+    assert allocator.allocate_count(3, 2) == ["SKA001", "SKA036"]
+
+
+def test_full_mid_array():
+    """Assert that the full Mid array can be partitioned into 16 sub-arrays."""
+    allocation = allocate_dishes(MID_ARRAY, {sub_id: 12 for sub_id in range(1, 17)})
+    allocated = [d for sub in allocation.values() for d in sub["DishIDs"]]
+    assert len(allocated) == 192
+    assert len(set(allocated)) == 192
+    assert allocation[16]["instances"][-1] == "058"
+    with pytest.raises(AllocationError, match="only 5 free"):
+        allocate_dishes(MID_ARRAY, {1: 192, 2: 6})
+
+
+def test_tmc_values_with_subarrays(monkeypatch: pytest.MonkeyPatch):
+    """
+    Assert that tmc_values adds per-subarray DishIDs when a sub-array spec is given.
+
+    :param monkeypatch: pytest monkeypatch fixture
+    """
+    monkeypatch.delenv("DISH_IDS", raising=False)
+    monkeypatch.setenv("SUBARRAY_DISH_IDS", "1=SKA100;2=2")
+    values = tmc_values(dish_ids="SKA001 SKA036 SKA063 SKA100")
+    subarraynode = values["ska-tmc-mid"]["deviceServers"]["subarraynode"]
+    assert subarraynode["DishIDs"] == ["SKA001", "SKA036", "SKA063", "SKA100"]
+    assert subarraynode["subarrays"] == {
+        "1": {"DishIDs": ["SKA100"], "instances": ["100"]},
+        "2": {"DishIDs": ["SKA001", "SKA036"], "instances": ["001", "036"]},
+    }
@@ -0,0 +1,123 @@
+"""Tests for validating TMC values against the ska-tmc-mid values schema."""
+
+import os
+
+import pytest
+
+from ska_mid_itf_engineering_tools.tmc_config import values_schema
+from ska_mid_itf_engineering_tools.tmc_config.tmc_dish_ids import tmc_values
+from ska_mid_itf_engineering_tools.tmc_config.values_schema import (
+    CompiledSchema,
+    ValuesValidationError,
+    check_dish_ids,
+    compile_schema,
+    validate_values,
+)
+
+
+@pytest.fixture(name="values")
+def fixture_values(monkeypatch: pytest.MonkeyPatch) -> dict:
+    """
+    Generate TMC values for four dishes, independent of the environment.
+
+    :param monkeypatch: pytest monkeypatch fixture
+    :return: generated values
+    """
+    for name in ["DISH_IDS", "CLUSTER_DOMAIN_POSTFIX", "KUBE_NAMESPACE_PREFIX"]:
+        monkeypatch.delenv(name, raising=False)
+    return tmc_values(dish_ids="SKA001 SKA036 SKA063 MKT100")
+
+
+def test_check_dish_ids():
+    """Assert that DishID format and uniqueness are checked."""
+    assert check_dish_ids(["SKA001", "MKT063"]) == []
+    assert check_dish_ids(["SKA01", "ska001", "SKA0011"]) == [
+        "invalid DishID 'SKA01': expected SKAnnn or MKTnnn",
+        "invalid DishID 'ska001': expected SKAnnn or MKTnnn",
+        "invalid DishID 'SKA0011': expected SKAnnn or MKTnnn",
+    ]
+    assert check_dish_ids(["SKA001", "SKA001"]) == ["duplicate DishID 'SKA001'"]
+
+
+def test_generated_values_are_valid(values: dict, tmp_path):
+    """
+    Assert that the default generated values validate against the bundled schema.
+
+    :param values: generated values
+    :param tmp_path: pytest temporary directory
+    """
+    validate_values(values, cache_dir=str(tmp_path))
+
+
+def test_invalid_dish_id_fails_before_schema(values: dict, tmp_path):
+    """
+    Assert that a typo in DISH_IDS is reported without compiling the schema.
+
+    :param values: generated values
+    :param tmp_path: pytest temporary directory
+    """
+    values["ska-tmc-mid"]["deviceServers"]["centralnode"]["DishIDs"][1] = "SKA36"
+    with pytest.raises(ValuesValidationError) as err:
+        validate_values(values, cache_dir=str(tmp_path))
+    assert err.value.errors == ["centralnode: invalid DishID 'SKA36': expected SKAnnn or MKTnnn"]
+    assert os.listdir(tmp_path) == []
+
+
+def test_bad_namespace_prefix_is_reported(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    """
+    Assert that a namespace prefix which is not a valid DNS label is reported.
+
+    :param monkeypatch: pytest monkeypatch fixture
+    :param tmp_path: pytest temporary directory
+    """
+    monkeypatch.setenv("KUBE_NAMESPACE_PREFIX", "Dish_LMC-")
+    monkeypatch.delenv("DISH_IDS", raising=False)
+    monkeypatch.delenv("CLUSTER_DOMAIN_POSTFIX", raising=False)
+    values = tmc_values(dish_ids="SKA001")
+    with pytest.raises(ValuesValidationError) as err:
+        validate_values(values, cache_dir=str(tmp_path))
+    assert len(err.value.errors) == 1
+    assert err.value.errors[0].startswith("/global/namespace_dish/dish_names/0:")
+
+
+def test_compiled_schema_is_cached_by_chart_version(values: dict, tmp_path, monkeypatch):
+    """
+    Assert that the compiled schema is cached on disk and reused for the same chart version.
+
+    :param values: generated values
+    :param tmp_path: pytest temporary directory
+    :param monkeypatch: pytest monkeypatch fixture
+    """
+    chart_dir = tmp_path / "chart"
+    chart_dir.mkdir()
+    (chart_dir / "Chart.yaml").write_text(
+        "dependencies:\n- name: ska-tmc-mid\n  version: 0.19.0\n", encoding="utf-8"
+    )
+    cache_dir = tmp_path / "cache"
+    validate_values(values, chart_dir=str(chart_dir), cache_dir=str(cache_dir))
+    assert os.listdir(cache_dir) == ["ska-tmc-mid-0.19.0.compiled.json"]
+
+    def fail(_schema):
+        raise AssertionError("schema should not be recompiled")
+
+    monkeypatch.setattr(values_schema, "compile_schema", fail)
+    validate_values(values, chart_dir=str(chart_dir), cache_dir=str(cache_dir))
+
+
+def test_compile_schema_resolves_refs_and_checks_items():
+    """Assert that local references are resolved and array items are validated."""
+    schema = {
+        "definitions": {"port": {"type": "integer", "minimum": 1, "maximum": 65535}},
+        "type": "object",
+        "required": ["ports"],
+        "additionalProperties": False,
+        "properties": {"ports": {"type": "array", "items": {"$ref": "#/definitions/port"}}},
+    }
+    rules = compile_schema(schema)
+    assert rules["/ports/*"] == [["type", "integer"], ["minimum", 1], ["maximum", 65535]]
+    compiled = CompiledSchema(rules)
+    assert compiled.validate({"ports": [10000, 0]}) == ["/ports/1: 0 is less than 1"]
+    assert compiled.validate({"extra": True}) == [
+        "/: missing required properties ['ports']",
+        "/: unexpected properties ['extra']",
+    ]